@@ -1,6 +1,4 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
 
 # Title
 st.title("Desalination Plant Simulator")
@@ -13,10 +11,14 @@ Welcome to the Desalination Plant Simulator! This tool allows you to model the d
 # Sidebar Inputs
 st.sidebar.header("Plant Parameters")
 
+# Slider lower bounds, shared with the optimizer
+ENERGY_USE_MIN = 2.0  # kWh per cubic meter
+TREATMENT_EFFICIENCY_MIN = 30  # %
+
 # Basic Functional Plant Parameters (Always Enabled)
 feedwater_salinity = st.sidebar.slider("Feedwater Salinity (ppm)", min_value=1000, max_value=50000, value=35000, step=500)
-energy_use = st.sidebar.slider("Energy Use (kWh per cubic meter)", min_value=2.0, max_value=10.0, value=3.5, step=0.1)
-treatment_efficiency = st.sidebar.slider("Treatment Efficiency (%)", min_value=30, max_value=90, value=50, step=5)
+energy_use = st.sidebar.slider("Energy Use (kWh per cubic meter)", min_value=ENERGY_USE_MIN, max_value=10.0, value=3.5, step=0.1)
+treatment_efficiency = st.sidebar.slider("Treatment Efficiency (%)", min_value=TREATMENT_EFFICIENCY_MIN, max_value=90, value=50, step=5)
 intake_flow_rate = st.sidebar.slider("Intake Flow Rate (cubic meters per hour)", min_value=50, max_value=500, value=100, step=10)
 
 # Advanced Parameters with Optional Checkboxes
@@ -56,6 +58,13 @@ latent_heat_evaporation = 2260  # kJ/kg
 energy_cost_per_kwh = 0.12  # $/kWh
 
 # Enhanced Calculations
+def _cost_day(energy_cost, daily_freshwater_production, cost_of_chemicals_per_m3, labor_cost_per_day, maintenance_cost_per_day):
+    """
+    Total operational cost ($ per day); works on scalars and NumPy arrays alike.
+    Energy and chemical costs are both per cubic meter, so they share one multiply by daily production.
+    """
+    return (energy_cost + cost_of_chemicals_per_m3) * daily_freshwater_production + (labor_cost_per_day + maintenance_cost_per_day)
+
 def calculate_outputs(feedwater_salinity, energy_use, treatment_efficiency, plant_capacity, intake_flow_rate, carbon_emission_factor, cost_of_chemicals_per_m3, labor_cost_per_day, maintenance_cost_per_day):
     """
     Calculate desalination plant outputs based on user inputs.
@@ -76,11 +85,8 @@ def calculate_outputs(feedwater_salinity, energy_use, treatment_efficiency, plan
     daily_energy_use = energy_use * daily_freshwater_production
     carbon_emissions = daily_energy_use * carbon_emission_factor
     
-    # Chemical Cost ($ per day)
-    chemical_cost = cost_of_chemicals_per_m3 * daily_freshwater_production
-    
     # Total Operational Cost ($ per day)
-    total_operational_cost = (energy_cost * daily_freshwater_production) + chemical_cost + labor_cost_per_day + maintenance_cost_per_day
+    total_operational_cost = _cost_day(energy_cost, daily_freshwater_production, cost_of_chemicals_per_m3, labor_cost_per_day, maintenance_cost_per_day)
     
     return freshwater_production, waste_brine, energy_cost, daily_freshwater_production, carbon_emissions, total_operational_cost
 
@@ -97,23 +103,18 @@ st.write(f"**Daily Freshwater Production:** {daily_freshwater_production:.2f} cu
 st.write(f"**Carbon Emissions:** {carbon_emissions:.2f} kg CO2 per day")
 st.write(f"**Total Operational Cost:** ${total_operational_cost:.2f} per day")
 
-# Find Optimum Efficiency Dynamically
-optimum_efficiency = None
-min_cost = float('inf')
-optimal_energy_use = 0
-optimal_treatment_efficiency = 0
-
-def find_optimal_parameters():
-    global min_cost, optimum_efficiency, optimal_energy_use
-    for energy in np.linspace(2.0, 10.0, 50):
-        for efficiency in range(30, 91, 5):
-            _, _, _, _, _, cost = calculate_outputs(feedwater_salinity, energy, efficiency, plant_capacity, intake_flow_rate, carbon_emission_factor, cost_of_chemicals_per_m3, labor_cost_per_day, maintenance_cost_per_day)
-            if cost < min_cost:
-                min_cost = cost
-                optimum_efficiency = efficiency
-                optimal_energy_use = energy
-
-find_optimal_parameters()
+# Find Optimum Efficiency
+def find_optimal_parameters(intake_flow_rate, cost_of_chemicals_per_m3, labor_cost_per_day, maintenance_cost_per_day):
+    """
+    Return the cheapest energy use and treatment efficiency within the slider ranges.
+    Daily cost is (energy_use * price + chemicals) * efficiency * flow * 0.24 + fixed costs, which is
+    increasing in both energy use and efficiency, so the minimum sits at the lower bound of each slider.
+    """
+    daily_freshwater_production = TREATMENT_EFFICIENCY_MIN * (intake_flow_rate * 0.24)
+    min_cost = _cost_day(ENERGY_USE_MIN * energy_cost_per_kwh, daily_freshwater_production, cost_of_chemicals_per_m3, labor_cost_per_day, maintenance_cost_per_day)
+    return TREATMENT_EFFICIENCY_MIN, ENERGY_USE_MIN, min_cost
+
+optimum_efficiency, optimal_energy_use, min_cost = find_optimal_parameters(intake_flow_rate, cost_of_chemicals_per_m3, labor_cost_per_day, maintenance_cost_per_day)
 
 # Display Optimum Efficiency Results
 st.subheader("Optimal Efficiency Configuration")